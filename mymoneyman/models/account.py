@@ -29,32 +29,24 @@ class AccountGroup(enum.IntEnum):
 
     @staticmethod
     def fromAccountType(account_type: AccountType) -> AccountGroup:
-        T = AccountType
-
-        if account_type in (T.Asset, T.Cash, T.Bank, T.Receivable, T.Security):
-            return AccountGroup.Asset
-        elif account_type in (T.Liability, T.CreditCard, T.Payable):
-            return AccountGroup.Liability
-        elif account_type == T.Income:
-            return AccountGroup.Income
-        elif account_type == T.Expense:
-            return AccountGroup.Expense
-        else:
-            return AccountGroup.Equity
+        return _account_group_by_type[account_type]
 
     def accountTypes(self) -> typing.Tuple[AccountType]:
-        T = AccountType
-
-        if self == AccountGroup.Asset:
-            return (T.Asset, T.Cash, T.Bank, T.Receivable, T.Security)
-        elif self == AccountGroup.Liability:
-            return (T.Liability, T.CreditCard, T.Payable)
-        elif self == AccountGroup.Income:
-            return (T.Income,)
-        elif self == AccountGroup.Expense:
-            return (T.Expense,)
-        else:
-            return (T.Equity,)
+        return _account_types_by_group[self]
+
+_account_types_by_group: typing.Dict[AccountGroup, typing.Tuple[AccountType]] = {
+    AccountGroup.Asset:     (AccountType.Asset, AccountType.Cash, AccountType.Bank, AccountType.Receivable, AccountType.Security),
+    AccountGroup.Liability: (AccountType.Liability, AccountType.CreditCard, AccountType.Payable),
+    AccountGroup.Income:    (AccountType.Income,),
+    AccountGroup.Expense:   (AccountType.Expense,),
+    AccountGroup.Equity:    (AccountType.Equity,)
+}
+
+_account_group_by_type: typing.Dict[AccountType, AccountGroup] = {
+    account_type: group
+    for group, account_types in _account_types_by_group.items()
+    for account_type in account_types
+}
 
 class Account(models.sql.Base):
     """Defines the SQL table `account`."""
@@ -79,7 +71,8 @@ class AccountTreeItem:
         '_name',
         '_desc',
         '_parent',
-        '_children'
+        '_children',
+        '_row'
     )
 
     def __init__(self, 
@@ -95,6 +88,7 @@ class AccountTreeItem:
         self._desc            = description
         self._parent          = parent
         self._children        = []
+        self._row             = 0
 
     def id(self) -> typing.Optional[int]:
         return self._id
@@ -115,15 +109,34 @@ class AccountTreeItem:
         return self._children.copy()
 
     def appendChild(self, child: AccountTreeItem):
+        child._row = len(self._children)
         self._children.append(child)
 
+    def removeChildren(self, row: int, count: int):
+        """Removes `count` contiguous children starting at `row`."""
+
+        removed = self._children[row:row + count]
+        del self._children[row:row + count]
+
+        for child in removed:
+            child._parent = None
+
+        for i in range(row, len(self._children)):
+            self._children[i]._row = i
+
     def findChild(self, id: int) -> typing.Optional[AccountTreeItem]:
-        for child in self._children:
-            if child.id == id:
-                return child
-            
-            return child.findChild(id)
-        
+        """Searches this item's subtree in pre-order for an item with the given id."""
+
+        stack = list(reversed(self._children))
+
+        while stack:
+            item = stack.pop()
+
+            if item._id == id:
+                return item
+
+            stack.extend(reversed(item._children))
+
         return None
 
     def child(self, row: int) -> typing.Optional[AccountTreeItem]:
@@ -136,10 +149,7 @@ class AccountTreeItem:
         return len(self._children)
 
     def row(self) -> int:
-        if self._parent is None:
-            return 0
-        
-        return self._parent._children.index(self)
+        return self._row
 
     def __repr__(self) -> str:
         if self._parent is None:
@@ -171,7 +181,10 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
     a group exists, call `hasGroup()`.
     """
 
-    __slots__ = '_top_level_items'
+    __slots__ = (
+        '_top_level_items',
+        '_items_by_id'
+    )
 
     def __init__(self, parent: typing.Optional[QObject] = None):
         super().__init__(parent)
@@ -179,9 +192,9 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
         self._resetTopLevelItems([])
 
     def reset(self):
-        self.layoutAboutToBeChanged()
+        self.beginResetModel()
         self._resetTopLevelItems([])
-        self.layoutChanged()
+        self.endResetModel()
 
     def select(self, groups: typing.Sequence[AccountGroup]):
         """Retrieves all accounts groups from the database into this model."""
@@ -196,34 +209,32 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
         account_info = collections.defaultdict(list)
 
         with models.sql.get_session() as session:
-            #   SELECT * 
+            #   SELECT parent_id, id, type, name
             #     FROM account
             #    WHERE type in :account_types
             # ORDER BY type, parent_id, id
             stmt = (
-                sa.select(Account)
+                sa.select(Account.parent_id, Account.id, Account.type, Account.name)
                   .where(Account.type.in_(tuple(account_types)))
                   .order_by(Account.type, Account.parent_id, Account.id)
             )
 
-            result = session.execute(stmt).all()
-
-            for t in result:
-                acc: Account = t[0]
-                account_info[acc.parent_id].append((acc.id, acc.type, acc.name))
+            for parent_id, acc_id, acc_type, acc_name in session.execute(stmt):
+                account_info[parent_id].append((acc_id, acc_type, acc_name))
 
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self._resetTopLevelItems(account_groups)
 
         try:
             def read_recursive(item: AccountTreeItem):
                 try:
-                    info_list = account_info[item.id()]
+                    info_list = account_info.pop(item.id())
                 except KeyError:
                     return
 
                 for acc_id, acc_type, acc_name in info_list:
                     child = AccountTreeItem(acc_id, acc_type, acc_name, '', item)
+                    self._items_by_id[acc_id] = child
                     read_recursive(child)
                     
                     item.appendChild(child)
@@ -236,6 +247,7 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
                 top_level_item = self.topLevelItem(acc_group)
 
                 child = AccountTreeItem(acc_id, acc_type, acc_name, '', top_level_item)
+                self._items_by_id[acc_id] = child
                 read_recursive(child)
 
                 top_level_item.appendChild(child)
@@ -243,7 +255,7 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
         except KeyError:
             pass
 
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def hasAccount(self, name: str, type: AccountType, parent_id: typing.Optional[int]) -> bool:
         """Returns whether a group with the given values exists in the database."""
@@ -291,21 +303,19 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
             session.flush([acc]) # We need the auto-incremented id.
             session.commit()
 
-            self.layoutAboutToBeChanged.emit()
-
-            top_level_item = self.topLevelItem(AccountGroup.fromAccountType(type))
-
             if parent_id is None:
-                child = AccountTreeItem(acc.id, type, name, description, top_level_item)
-                top_level_item.appendChild(child)
+                parent_item = self.topLevelItem(AccountGroup.fromAccountType(type))
             else:
-                parent_item = top_level_item.findChild(acc.id)
+                parent_item = self._items_by_id.get(parent_id)
 
-                if parent_item is not None:
-                    child = AccountTreeItem(acc.id, type, name, description, parent_item)
-                    parent_item.appendChild(child)
+            if parent_item is not None:
+                row = parent_item.childCount()
 
-            self.layoutChanged.emit()
+                self.beginInsertRows(self.createIndex(parent_item.row(), 0, parent_item), row, row)
+                child = AccountTreeItem(acc.id, type, name, description, parent_item)
+                parent_item.appendChild(child)
+                self._items_by_id[acc.id] = child
+                self.endInsertRows()
 
             return True
 
@@ -313,20 +323,17 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
         """Removes an account from the database given its id."""
 
         with models.sql.get_session() as session:
-            account = session.query(Account).filter(Account.id == id).first()
+            # DELETE FROM account WHERE id = :id
+            result = session.execute(sa.delete(Account).where(Account.id == id))
+            session.commit()
 
-            if account is None:
+            if result.rowcount == 0:
                 return False
 
-            session.delete(account)
-            session.commit()
-        
         index = self.indexFromId(id)
 
         if index.isValid():
-            self.layoutAboutToBeChanged.emit()
-            self.removeRow(0, index.parent())
-            self.layoutChanged.emit()
+            self.removeRow(index.row(), index.parent())
 
         return True
 
@@ -336,15 +343,14 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
         return self._top_level_items[group.value]
 
     def indexFromId(self, account_id: int) -> QtCore.QModelIndex:
-        for row in range(self.rowCount()):
-            top_level_index = self.index(row, 0)
+        """Returns the index of the item whose id is `account_id`, or an invalid index if there's none."""
 
-            index = self._indexFromId(account_id, top_level_index)
+        item = self._items_by_id.get(account_id)
 
-            if index.isValid():
-                return index
+        if item is None:
+            return QtCore.QModelIndex()
 
-        return QtCore.QModelIndex()
+        return self.createIndex(item.row(), 0, item)
 
     def itemFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional[AccountTreeItem]:
         """Returns an item by its associated index if `index` is valid, and `None` otherwise."""
@@ -359,34 +365,26 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
     ################################################################################
     def _resetTopLevelItems(self, groups: typing.Sequence[AccountGroup]):
         self._top_level_items = [None, None, None, None]
+        self._items_by_id     = {}
 
         def setTopLevelItem(account_group: AccountGroup, account_type: AccountType):
-            self._top_level_items[account_group.value] = AccountTreeItem(None, account_type, account_group.name, '', None)
+            top_level_item = AccountTreeItem(None, account_type, account_group.name, '', None)
+            top_level_item._row = account_group.value
+
+            self._top_level_items[account_group.value] = top_level_item
 
         if AccountGroup.Asset     in groups: setTopLevelItem(AccountGroup.Asset,     AccountType.Asset)
         if AccountGroup.Liability in groups: setTopLevelItem(AccountGroup.Liability, AccountType.Liability)
         if AccountGroup.Income    in groups: setTopLevelItem(AccountGroup.Income,    AccountType.Income)
         if AccountGroup.Expense   in groups: setTopLevelItem(AccountGroup.Expense,   AccountType.Expense)
 
-    def _indexFromId(self, account_id: int, parent: QtCore.QModelIndex) -> QtCore.QModelIndex:
-        if not parent.isValid():
-            return QtCore.QModelIndex()
-
-        if (not self.hasChildren(parent)) or (parent.flags() & QtCore.Qt.ItemFlags.ItemNeverHasChildren):
-            return QtCore.QModelIndex()
-
-        rows = self.rowCount(parent)
-
-        for i in range(rows):
-            child_index = self.index(i, 0, parent)
-            child_item: AccountTreeItem = child_index.internalPointer()
+    def _forgetItems(self, items: typing.Iterable[AccountTreeItem]):
+        stack = list(items)
 
-            if child_item.id() == account_id:
-                return child_index
-            
-            return self._indexFromId(account_id, child_index)
-        
-        return QtCore.QModelIndex()
+        while stack:
+            item = stack.pop()
+            self._items_by_id.pop(item.id(), None)
+            stack.extend(item._children)
 
     ################################################################################
     # Overloaded methods
@@ -448,6 +446,31 @@ class AccountTreeModel(QtCore.QAbstractItemModel):
 
         return None
 
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        # Top-level items are static and cannot be removed.
+        if not parent.isValid():
+            return False
+
+        parent_item: AccountTreeItem = parent.internalPointer()
+
+        if count <= 0 or row < 0 or (row + count) > parent_item.childCount():
+            return False
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._forgetItems(parent_item._children[row:row + count])
+        parent_item.removeChildren(row, count)
+        self.endRemoveRows()
+
+        return True
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if not parent.isValid():
+            return True
+
+        parent_item: AccountTreeItem = parent.internalPointer()
+
+        return len(parent_item._children) > 0
+
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         if not parent.isValid():
             return 4
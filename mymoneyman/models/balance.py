@@ -1,11 +1,43 @@
 from __future__ import annotations
 import collections
 import decimal
+import functools
 import typing
 import sqlalchemy as sa
 from PyQt5      import QtCore
 from mymoneyman import utils, models
 
+@functools.lru_cache(maxsize=None)
+def _balance_statement(group: models.AccountGroup) -> sa.sql.Select:
+    """Returns the statement used by `BalanceTreeModel.select()`, built once per group."""
+
+    account_types = group.accountTypes()
+
+    ################################################################################
+    #          SELECT a.parent_id, a.id, a.name, a.description, COALESCE(SUM(t.quantity), 0)
+    #            FROM account        AS a
+    # LEFT OUTER JOIN subtransaction AS t ON t.account_id = a.id
+    #           WHERE a.type in :account_types
+    #        GROUP BY a.id
+    #-------------------------------------------------------------------------------
+    # Explanation:
+    #
+    # Select all accounts in `account_types`, summing up their transactions. The
+    # outer join keeps accounts that have no transactions, leaving their balance
+    # as 0.
+    ################################################################################
+
+    T = models.Subtransaction
+    A = models.Account
+
+    return (
+        sa.select(A.parent_id, A.id, A.name, A.description, sa.func.coalesce(sa.func.sum(T.quantity), 0))
+          .select_from(A)
+          .outerjoin(T, T.account_id == A.id)
+          .where(A.type.in_(account_types))
+          .group_by(A.id)
+    )
+
 class BalanceTreeItem:
     """Contains information of an item of `BalanceTreeModel`."""
 
@@ -15,7 +47,10 @@ class BalanceTreeItem:
         '_description',
         '_balance',
         '_parent',
-        '_children'
+        '_children',
+        '_row',
+        '_total_balance',
+        '_total_balance_text'
     )
 
     def __init__(self,
@@ -31,6 +66,10 @@ class BalanceTreeItem:
         self._balance     = balance
         self._parent      = parent
         self._children    = []
+        self._row         = 0
+
+        self._total_balance      = None
+        self._total_balance_text = None
 
     def id(self) -> int:
         return self._id
@@ -44,6 +83,22 @@ class BalanceTreeItem:
     def balance(self) -> decimal.Decimal:
         return self._balance
 
+    def totalBalance(self) -> decimal.Decimal:
+        """Returns the balance of this item summed with that of its children."""
+
+        if self._total_balance is None:
+            self._total_balance = self._balance + sum(child._balance for child in self._children)
+
+        return self._total_balance
+
+    def totalBalanceText(self) -> str:
+        """Returns `totalBalance()` in short format, as displayed by `BalanceTreeModel`."""
+
+        if self._total_balance_text is None:
+            self._total_balance_text = utils.short_format_number(self.totalBalance(), 2)
+
+        return self._total_balance_text
+
     def parent(self) -> typing.Optional[BalanceTreeItem]:
         return self._parent
 
@@ -51,7 +106,10 @@ class BalanceTreeItem:
         return self._children.copy()
 
     def appendChild(self, child: BalanceTreeItem):
+        child._row = len(self._children)
         self._children.append(child)
+        self._total_balance      = None
+        self._total_balance_text = None
 
     def child(self, row: int) -> typing.Optional[BalanceTreeItem]:
         try:
@@ -63,10 +121,7 @@ class BalanceTreeItem:
         return len(self._children)
     
     def row(self) -> int:
-        if self._parent is None:
-            return 0
-
-        return self._parent._children.index(self)
+        return self._row
 
     def __repr__(self) -> str:
         if self._parent is None:
@@ -87,7 +142,7 @@ class BalanceTreeModel(QtCore.QAbstractItemModel):
     and account groups.
     """
 
-    __slots__ = '_root_item'
+    __slots__ = ('_root_item',)
 
     def __init__(self, parent: typing.Optional[QtCore.QObject] = None):
         super().__init__(parent)
@@ -95,65 +150,20 @@ class BalanceTreeModel(QtCore.QAbstractItemModel):
         self._resetRootItem()
 
     def reset(self):
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self._resetRootItem()
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def select(self, group: models.AccountGroup):
         balance_info = collections.defaultdict(list)
 
-        account_types = group.accountTypes()
-
         with models.sql.get_session() as session:
-            ################################################################################
-            #    SELECT a.parent_id, a.id, a.name, a.description, SUM(t.quantity)
-            #      FROM subtransaction AS t
-            #      JOIN account        AS a ON t.account_id = a.id
-            #     WHERE a.type in :account_types
-            #  GROUP BY a.id
-            # UNION ALL
-            #    SELECT a.parent_id, a.id, a.name, a.description, 0
-            #      FROM account AS a
-            #     WHERE a.type in :account_types
-            #       AND (SELECT COUNT() FROM subtransaction AS t WHERE t.account_id = a.id) = 0
-            #-------------------------------------------------------------------------------
-            # Explanation:
-            #
-            # (Select all accounts that have transactions and are in `account_types`,
-            #  summing up their transactions.)
-            # UNION ALL
-            # (Select all accounts that have no transactions and are in `account_types`,
-            #  leaving their balance as 0.)
-            ################################################################################
-
-            T = models.Subtransaction
-            A = models.Account
-
-            stmt = sa.union_all(
-                (
-                    sa.select(A.parent_id, A.id, A.name, A.description, sa.func.sum(T.quantity))
-                      .select_from(T)
-                      .join(A, T.account_id == A.id)
-                      .where(A.type.in_(account_types))
-                      .group_by(A.id)
-                ),
-                (
-                    sa.select(A.parent_id, A.id, A.name, A.description, sa.literal(0))
-                      .where(A.type.in_(account_types))
-                      .where(
-                            sa.select(sa.func.count())
-                              .where(T.account_id == A.id)
-                              .scalar_subquery() == 0
-                        )
-                )
-            )
-
-            for t in session.execute(stmt).all():
-                parent_id, id, name, desc, balance = t
+            stmt = _balance_statement(group)
 
+            for parent_id, id, name, desc, balance in session.execute(stmt):
                 balance_info[parent_id].append((id, name, desc, balance))
 
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self._resetRootItem()
 
         try:
@@ -180,10 +190,10 @@ class BalanceTreeModel(QtCore.QAbstractItemModel):
         except KeyError:
             pass
             
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def totalBalance(self) -> decimal.Decimal:
-        return sum(top_level_item.balance() for top_level_item in self._root_item.children())
+        return sum(top_level_item.balance() for top_level_item in self._root_item._children)
 
     def itemFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional[BalanceTreeItem]:
         if not index.isValid():
@@ -244,9 +254,7 @@ class BalanceTreeModel(QtCore.QAbstractItemModel):
         elif column == 1: return item.description()
         elif column == 2:
             # TODO: maybe move summing logic to query when having to deal with currency rates.
-            total_balance = item.balance() + sum(child.balance() for child in item.children())
-
-            return  utils.short_format_number(total_balance, 2)
+            return item.totalBalanceText()
         else:
             return None
 
@@ -262,6 +270,14 @@ class BalanceTreeModel(QtCore.QAbstractItemModel):
 
         return None
 
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if not parent.isValid():
+            parent_item = self._root_item
+        else:
+            parent_item: BalanceTreeItem = parent.internalPointer()
+
+        return len(parent_item._children) > 0
+
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         if not parent.isValid():
             parent_item = self._root_item
@@ -8,40 +8,53 @@ meta = sa.MetaData()
 Base = sa_orm.declarative_base(metadata=meta)
 
 _engine: typing.Optional[sa.engine.Engine] = None
+_Session: typing.Optional[sa_orm.sessionmaker] = None
 
 # Adapted from 
 class Decimal(sa_types.TypeDecorator):
     """ e.g. value = Column(Decimal(2)) means a value such as
     # Decimal('12.34') will be converted to 1234 in Sqlite
     """
-    impl = sa_types.Integer
+    impl     = sa_types.Integer
+    cache_ok = True
 
     def __init__(self, decimal_places: int):
         super().__init__()
 
         self.decimal_places = decimal_places
         self.multiplier_int = 10 ** self.decimal_places
+        self.exponent       = -self.decimal_places
 
     def process_bind_param(self, value, dialect):
-        if value is not None:
-            value = int(decimal.Decimal(value) * self.multiplier_int)
+        if value is None:
+            return None
 
-        return value
+        if isinstance(value, int):
+            return value * self.multiplier_int
+
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(value)
+
+        return int(value.scaleb(self.decimal_places))
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            value = decimal.Decimal(value) / self.multiplier_int
+            value = decimal.Decimal(value).scaleb(self.exponent)
 
         return value
 
 def set_engine(filepath: str):
-    global _engine
+    global _engine, _Session
 
     if _engine is not None:
         _engine.dispose()
     
-    _engine = sa.create_engine(f'sqlite:///{filepath}', echo=True, future=True)
+    _engine = sa.create_engine(f'sqlite:///{filepath}', future=True)
     meta.create_all(_engine)
 
+    # Objects are only read back right after commit (e.g. an auto-incremented id),
+    # so there's no need to expire them and reload on access.
+    _Session = sa_orm.sessionmaker(bind=_engine, future=True, expire_on_commit=False)
+
 def get_session() -> sa_orm.Session:
-    return sa_orm.Session(_engine)
\ No newline at end of file
+    return _Session()
\ No newline at end of file
@@ -1,21 +1,18 @@
 import decimal
 
+_thousands_letters = ('', 'K', 'M', 'B', 'T')
+
 def short_format_number(number: decimal.Decimal, decimals: int = 0) -> str:
     thousands = 0
+    max_thousands = len(_thousands_letters) - 1
 
     n = abs(number)
 
-    while n > 1000:
+    while n > 1000 and thousands < max_thousands:
         n /= 1000
         thousands += 1
-    
-    thousands_letter = ('', 'K', 'M', 'B', 'T')
-
-    try:
-        letter = thousands_letter[thousands]
-        number = round(number / (1000 ** thousands), decimals)
 
-        return f'{number}{letter}'
+    letter = _thousands_letters[thousands]
+    number = round(number / (1000 ** thousands), decimals)
 
-    except IndexError:
-        return round(number, decimals)
\ No newline at end of file
+    return f'{number}{letter}'
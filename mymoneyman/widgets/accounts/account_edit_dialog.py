@@ -1,6 +1,7 @@
 import collections
 import decimal
 import enum
+import logging
 import typing
 from PyQt5              import QtCore, QtGui, QtWidgets
 from mymoneyman.widgets import accounts as widgets
@@ -8,6 +9,8 @@ from mymoneyman         import models
 
 _GroupComboData = collections.namedtuple('_GroupComboData', ['account_group', 'account_type'])
 
+_logger = logging.getLogger(__name__)
+
 class AccountEditDialog(QtWidgets.QDialog):
     class EditionMode(enum.IntEnum):
         Creation = 0
@@ -149,12 +152,12 @@ class AccountEditDialog(QtWidgets.QDialog):
 
                 QtWidgets.QMessageBox.information(self, 'Account exists', description)
             else:
-                print('insert account (name:', account_name, 'type:', account_type, 'parent id:', parent_id, ')')
+                _logger.debug('insert account (name: %r type: %s parent id: %s)', account_name, account_type, parent_id)
 
                 if model.addAccount(account_name, account_type, account_desc, parent_id):
                     self.accept()
                 else:
-                    print('rejecting...')
+                    _logger.debug('rejecting...')
                     self.reject()
         else:
             # TODO
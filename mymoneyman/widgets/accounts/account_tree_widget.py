@@ -17,6 +17,7 @@ class AccountTreeWidget(QtWidgets.QWidget):
     def _initWidgets(self):
         self._view = QtWidgets.QTreeView()
         self._view.setFont(QtGui.QFont('IPAPGothic', 11)) # TODO: make font user-defined
+        self._view.setUniformRowHeights(True)
         self._view.setModel(models.AccountTreeModel())
         self._view.clicked.connect(self._onIndexClicked)
 
@@ -26,6 +26,7 @@ class BalanceTreeWidget(QtWidgets.QWidget):
         self._view.setSelectionBehavior(QtWidgets.QTreeView.SelectionBehavior.SelectRows)
         self._view.selectionModel().currentRowChanged.connect(self._onCurrentRowChanged)
         self._view.setFont(QtGui.QFont('IPAPGothic', 11))
+        self._view.setUniformRowHeights(True)
 
         self._group = None
 